@@ -11,6 +11,10 @@ AUTO_SIZE_PADDING_FACTOR = 0.90 # How much of the screen the maze should use in
 FALLBACK_CELL_SIZE = 10
 MIN_CELL_SIZE = 3 # Minimum pixel size for a cell to be somewhat visible
 
+# Grid cell characters shared by the generator, the solvers and the display
+WALL_CHAR = '#'
+PATH_CHAR = ' '
+
 # Core Maze Colors
 WALL_COLOR = (30, 30, 40) # Darker wall
 PATH_COLOR = (230, 230, 240) # Off-white path
@@ -19,31 +23,31 @@ END_NODE_COLOR = (200, 0, 0)   # Bright red
 MAZE_BACKGROUND_COLOR = (50, 50, 60) # Background for the maze area if it doesn't fill screen
 
 # Solver Visualization Colors
-# Using a dictionary for solver-specific colors for clarity and expansion
+# Flat lookup keyed by (solver_name, role) so each render pass needs a single dict hit
 SOLVER_COLORS = {
-    "BFS": {
-        "visited": (100, 100, 200, 180),  # Light Blue, with alpha for visited
-        "path": (50, 50, 255, 220),     # Darker Blue, with alpha for current path
-        "final_path": (0, 0, 255)       # Solid Blue for final path
-    },
-    "DFS": {
-        "visited": (100, 200, 100, 180),  # Light Green
-        "path": (50, 255, 50, 220),     # Darker Green
-        "final_path": (0, 200, 0)       # Solid Green
-    },
-    "A*": {
-        "visited": (200, 100, 100, 180),  # Light Red
-        "path": (255, 50, 50, 220),     # Darker Red
-        "final_path": (200, 0, 0)       # Solid Red
-    },
-    "DEFAULT": { # Fallback if a solver name is not in the dict
-        "visited": (180, 180, 180, 180), # Light Gray
-        "path": (150, 150, 150, 220),    # Darker Gray
-        "final_path": (100, 100, 100)    # Solid Gray
-    }
+    ("BFS", "visited"): (100, 100, 200, 180),     # Light Blue, with alpha for visited
+    ("BFS", "path"): (50, 50, 255, 220),          # Darker Blue, with alpha for current path
+    ("BFS", "final_path"): (0, 0, 255),           # Solid Blue for final path
+
+    ("DFS", "visited"): (100, 200, 100, 180),     # Light Green
+    ("DFS", "path"): (50, 255, 50, 220),          # Darker Green
+    ("DFS", "final_path"): (0, 200, 0),           # Solid Green
+
+    ("A*", "visited"): (200, 100, 100, 180),      # Light Red
+    ("A*", "path"): (255, 50, 50, 220),           # Darker Red
+    ("A*", "final_path"): (200, 0, 0),            # Solid Red
+
+    # Fallback if a solver name is not in the dict
+    ("DEFAULT", "visited"): (180, 180, 180, 180), # Light Gray
+    ("DEFAULT", "path"): (150, 150, 150, 220),    # Darker Gray
+    ("DEFAULT", "final_path"): (100, 100, 100),   # Solid Gray
 }
 # Alpha values (0-255) will be used for visited/path overlays on the maze path color.
 
+def get_solver_color(solver_name, role):
+    """Returns the color for a solver's role ("visited", "path", "final_path"), falling back to DEFAULT."""
+    return SOLVER_COLORS.get((solver_name, role)) or SOLVER_COLORS[("DEFAULT", role)]
+
 # UI Theme - General
 APP_BACKGROUND_COLOR = (40, 40, 50) # Overall background for window
 TEXT_COLOR = (220, 220, 230)
@@ -119,6 +123,9 @@ CHOICE_BOX_HOVER_COLOR = (75, 75, 90)
 CHOICE_BOX_SELECTED_COLOR = PRIMARY_ACCENT_COLOR
 CHOICE_BOX_SELECTED_TEXT_COLOR = (255,255,255)
 CHOICE_BOX_TEXT_COLOR = TEXT_COLOR
+# Hover shades for the choice boxes, lerped once here instead of on every style refresh
+CHOICE_BOX_NORMAL_HOVER_COLOR = pygame.Color(CHOICE_BOX_NORMAL_COLOR).lerp(pygame.Color("white"), 0.15)
+CHOICE_BOX_SELECTED_HOVER_COLOR = pygame.Color(CHOICE_BOX_SELECTED_COLOR).lerp(pygame.Color("white"), 0.15)
 
 # Timer / Status Info
 TIMER_TEXT_COLOR = TEXT_COLOR
@@ -126,9 +133,22 @@ TIMER_FONT_SIZE = FONT_SIZE_MEDIUM
 
 # Event Timers
 AI_SOLVE_STEP_EVENT = pygame.USEREVENT + 1
+# Input events nothing in the app reacts to; blocked at startup so they never reach the event loop.
+# Text input and window events stay allowed, as SDL derives KEYDOWN text and VIDEORESIZE from them.
+UNHANDLED_EVENT_TYPES = (
+    pygame.KEYUP, pygame.MOUSEWHEEL,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION, pygame.MULTIGESTURE,
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+    pygame.CONTROLLERAXISMOTION, pygame.CONTROLLERBUTTONDOWN, pygame.CONTROLLERBUTTONUP,
+    pygame.CONTROLLERDEVICEADDED, pygame.CONTROLLERDEVICEREMOVED, pygame.CONTROLLERDEVICEREMAPPED,
+    pygame.AUDIODEVICEADDED, pygame.AUDIODEVICEREMOVED,
+    pygame.DROPFILE, pygame.DROPTEXT, pygame.DROPBEGIN, pygame.DROPCOMPLETE,
+)
 
 # Solver Logic Config
-SOLVER_OPTIONS = ["BFS", "DFS", "A*"]
+SOLVER_OPTIONS = ("BFS", "DFS", "A*") # Ordered, for UI rendering
+SOLVER_OPTIONS_SET = frozenset(SOLVER_OPTIONS) # For membership checks
 DEFAULT_SOLVER = "BFS"
 
 # AI Speed Control (used by Slider in Settings)
@@ -138,8 +158,19 @@ MIN_DELAY_MS = 1        # Fastest actual delay for solver step
 MAX_DELAY_MS = 500      # Slowest actual delay for solver step
 SLIDER_EXPONENT = 3.0   # For non-linear mapping of slider to delay
 
+# Slider positions are integers, so the slider->delay curve is tabulated once here.
+# Index with (slider_value - SLIDER_MIN_VAL); higher slider value means a shorter delay.
+_SLIDER_SPAN = SLIDER_MAX_VAL - SLIDER_MIN_VAL
+SLIDER_DELAY_LUT = tuple(
+    int(max(MIN_DELAY_MS, min(MAX_DELAY_MS,
+        MIN_DELAY_MS + (1.0 - i / _SLIDER_SPAN) ** SLIDER_EXPONENT * (MAX_DELAY_MS - MIN_DELAY_MS))))
+    for i in range(_SLIDER_SPAN + 1)
+) if _SLIDER_SPAN else (MIN_DELAY_MS,) # A zero-width slider has a single position: the fastest delay
+
 # Screen & Display
 FPS = 60
+IDLE_EVENT_WAIT_MS = 50 # Longest the loop sleeps waiting for input while nothing animates
+RESIZE_SETTLE_MS = 100 # Relayout once the window size has stopped changing for this long
 
 # For drawing solver paths - how much smaller the inner rects are
 VISITED_CELL_SCALE = 0.6 # For the "visited" overlay
@@ -158,6 +189,7 @@ UI_ID_BTN_SAVE_MAZE = "btn_save_maze"
 NOTIFICATION_MAX_DISPLAY = 3
 NOTIFICATION_DURATION_MS = 3000 # How long a notification stays
 NOTIFICATION_FADE_DURATION_MS = 500
+NOTIFICATION_TEXT_CACHE_SIZE = 64 # Rendered messages kept for reuse; the oldest is dropped past this
 NOTIFICATION_AREA_WIDTH = 300
 NOTIFICATION_HEIGHT = 50
 NOTIFICATION_PADDING = 10
@@ -1,24 +1,46 @@
 import pygame
 import sys
 import argparse
+import importlib
+import logging
 import os
 
 import config
 from src.maze_generator import create_maze
 from ui.maze_display import MazeDisplay
-from ui.settings_window import SettingsWindow
-from ui.ui_elements import Button, Label # Other elements used within SettingsWindow
+from ui.ui_elements import Button, Label, get_font # Other elements used within SettingsWindow
 
-# Solvers
-from src.solvers.bfs_solver import solve_bfs_step_by_step
-from src.solvers.dfs_solver import solve_dfs_step_by_step
-from src.solvers.astar_solver import solve_astar_step_by_step
+logger = logging.getLogger(__name__)
 
+# Solvers, imported on first use: name -> (module path, step-by-step generator function name)
 SOLVER_ALGORITHMS = {
-    "BFS": solve_bfs_step_by_step,
-    "DFS": solve_dfs_step_by_step,
-    "A*": solve_astar_step_by_step,
+    "BFS": ("src.solvers.bfs_solver", "solve_bfs_step_by_step"),
+    "DFS": ("src.solvers.dfs_solver", "solve_dfs_step_by_step"),
+    "A*": ("src.solvers.astar_solver", "solve_astar_step_by_step"),
 }
+_loaded_solver_functions = {}
+
+def get_solver_function(solver_name):
+    """Returns the generator function for solver_name, importing its module on first use. None if unknown."""
+    solver_func = _loaded_solver_functions.get(solver_name)
+    if solver_func is None:
+        solver_spec = SOLVER_ALGORITHMS.get(solver_name)
+        if solver_spec is None:
+            return None
+        module_path, func_name = solver_spec
+        solver_func = getattr(importlib.import_module(module_path), func_name)
+        _loaded_solver_functions[solver_name] = solver_func
+    return solver_func
+
+def coalesce_mouse_motion(events):
+    """Drops every MOUSEMOTION in events except the last; the positions in between are never seen."""
+    last_motion = None
+    for event in events:
+        if event.type == pygame.MOUSEMOTION:
+            last_motion = event
+    if last_motion is None:
+        return events
+    return [event for event in events if event.type != pygame.MOUSEMOTION or event is last_motion]
 
 class UIManager:
     """Manages different UI states/screens and global UI elements."""
@@ -27,14 +49,28 @@ class UIManager:
         self.active_view = "main"  # "main", "settings"
         
         self.control_panel_elements = [] # Elements specific to the control panel
+        self._control_panel_buttons = [] # The subset that reacts to input, hit-tested per event and frame
+        self._last_hover_mouse_pos = None # Mouse position the buttons' hover state was last computed for
         self.settings_window_instance = None
         self.notification_manager = NotificationManager(screen)
 
     def add_control_panel_element(self, element):
         self.control_panel_elements.append(element)
+        if isinstance(element, Button):
+            self._control_panel_buttons.append(element)
 
     def clear_control_panel_elements(self):
         self.control_panel_elements.clear()
+        self._control_panel_buttons.clear()
+        self._last_hover_mouse_pos = None # New buttons need their hover state computed
+
+    def move_control_panel_elements(self, dy):
+        """Shifts every control panel element vertically by dy, keeping the elements and their cached faces."""
+        if not dy:
+            return
+        for element in self.control_panel_elements:
+            element.set_position(element.rect.x, element.rect.y + dy)
+        self._last_hover_mouse_pos = None # The buttons moved under the cursor
 
     def set_settings_window(self, window_instance):
         self.settings_window_instance = window_instance
@@ -52,7 +88,7 @@ class UIManager:
     def update_screen_reference(self, new_screen):
         """Updates screen reference for manager and its children that need it."""
         self.screen = new_screen
-        self.notification_manager.screen = new_screen
+        self.notification_manager.set_screen(new_screen)
         if self.settings_window_instance:
             self.settings_window_instance.screen_width = new_screen.get_width()
             self.settings_window_instance.screen_height = new_screen.get_height()
@@ -66,14 +102,17 @@ class UIManager:
                 consumed = True
         
         if not consumed and self.active_view == "main": # Only handle control panel if main view
-            for element in reversed(self.control_panel_elements):
+            for element in reversed(self._control_panel_buttons):
                 if element.visible and not element.disabled:
                     if element.handle_event(event, mouse_pos):
                         consumed = True
                         break
+            if not consumed and event.type == pygame.MOUSEMOTION:
+                # Every button just hit-tested this position, so update() need not repeat it
+                self._last_hover_mouse_pos = mouse_pos
         
         # Notifications always try to handle events (e.g., click to dismiss, not implemented yet)
-        if not consumed: # Avoid double consumption if a main UI element handled it.
+        if not consumed and self.notification_manager.notifications: # Avoid double consumption if a main UI element handled it.
             self.notification_manager.handle_event(event, mouse_pos)
         
         return consumed
@@ -82,18 +121,31 @@ class UIManager:
         if self.active_view == "settings" and self.settings_window_instance:
             self.settings_window_instance.update(dt, mouse_pos)
         
-        # Update control panel elements only if in main view (or always if they should be dynamic)
-        # For now, let's assume they are always updated for hover effects etc.
-        for element in self.control_panel_elements:
-            if element.visible:
-                element.update(dt, mouse_pos)
+        # Hover only changes when the mouse moves (or the buttons are rebuilt), so the per-button
+        # hit tests are skipped while the cursor is still
+        if mouse_pos != self._last_hover_mouse_pos:
+            self._last_hover_mouse_pos = mouse_pos
+            for element in self._control_panel_buttons: # Labels have nothing to update
+                if element.visible:
+                    element.update(dt, mouse_pos)
         
         self.notification_manager.update(dt)
 
     def draw_main_ui(self): # For elements outside maze_display and settings window
+        # Buttons and plain labels are single cached surfaces, handed to pygame in batched blits() calls
+        blit_items = []
         for element in self.control_panel_elements:
             if element.visible:
-                element.draw(self.screen)
+                blit_item = element.get_blit_item()
+                if blit_item is None:
+                    if blit_items: # Paint earlier elements first, keeping the list's draw order
+                        self.screen.blits(blit_items, doreturn=False)
+                        blit_items = []
+                    element.draw(self.screen)
+                else:
+                    blit_items.append(blit_item)
+        if blit_items:
+            self.screen.blits(blit_items, doreturn=False)
 
     def draw_settings_ui(self): # Settings window draws itself and its overlay
         if self.active_view == "settings" and self.settings_window_instance:
@@ -102,52 +154,109 @@ class UIManager:
     def draw_notifications(self):
         self.notification_manager.draw(self.screen)
 
+    def get_notification_dirty_rects(self):
+        """Returns rects covering notifications drawn this frame and those drawn last frame."""
+        return self.notification_manager.get_dirty_rects()
+
+    def consume_control_panel_changes(self):
+        """Returns True if any control panel element changed appearance since the last call."""
+        changed = False
+        for element in self.control_panel_elements:
+            if element.consume_visual_changes(): # Consume every flag, not just the first set one
+                changed = True
+        return changed
+
+    def has_active_notifications(self):
+        return bool(self.notification_manager.notifications)
+
 
 class NotificationManager:
     def __init__(self, screen):
         self.screen = screen
         self.notifications = []
-        self.font = pygame.font.Font(config.FONT_NAME, config.FONT_SIZE_SMALL)
+        self.font = get_font(config.FONT_NAME, config.FONT_SIZE_SMALL)
+        self._last_drawn_rects = [] # Rects drawn last frame, so vanished notifications get cleared
+        self._background_templates = {} # bar color -> pre-drawn notification background
+        self._text_cache = {} # text -> rendered message, oldest first; see _render_text()
+        self._x = self._column_x() # Left edge of the notification column, updated on resize
+
+    def _column_x(self):
+        return self.screen.get_width() - config.NOTIFICATION_AREA_WIDTH - config.NOTIFICATION_PADDING
+
+    def set_screen(self, screen):
+        """Switches to a new (resized) screen and moves the shown notifications to its right edge."""
+        self.screen = screen
+        self._x = self._column_x()
+        self._recalculate_notification_positions()
 
     def add_notification(self, text, type="info", duration_ms=None):
-        if len(self.notifications) >= config.NOTIFICATION_MAX_DISPLAY:
+        dropped_oldest = len(self.notifications) >= config.NOTIFICATION_MAX_DISPLAY
+        if dropped_oldest:
             self.notifications.pop(0)
 
-        text_surface = self.font.render(text, True, config.NOTIFICATION_TEXT_COLOR)
+        text_surface = self._render_text(text)
         
         bg_width = config.NOTIFICATION_AREA_WIDTH
         bg_height = config.NOTIFICATION_HEIGHT
         padding = config.NOTIFICATION_PADDING
         
-        x = self.screen.get_width() - bg_width - padding
-        # Y position will be calculated in update based on current notifications
-        rect = pygame.Rect(x, padding, bg_width, bg_height) # Initial Y
+        # Stacked below the notifications already shown
+        rect = pygame.Rect(self._x, padding + len(self.notifications) * (bg_height + padding // 2),
+                           bg_width, bg_height)
         
         notif_duration = duration_ms if duration_ms is not None else config.NOTIFICATION_DURATION_MS
 
+        bar_color = config.NOTIFICATION_INFO_BAR_COLOR
+        if type == "success": bar_color = config.SUCCESS_COLOR
+        elif type == "error": bar_color = config.ERROR_COLOR
+
+        # The whole notification is composited once here; draw() only sets its alpha and blits it
+        face = self._get_background_template(bar_color, rect.size).copy()
+        text_x = 5 + padding // 2 # Right of the colored bar
+        text_y = (bg_height - text_surface.get_height()) // 2
+        face.blit(text_surface, (text_x, text_y))
+
         notif = {
-            "text_surface": text_surface, "type": type, "rect": rect,
-            "start_time": pygame.time.get_ticks(), "alpha": 255.0,
-            "bar_color": config.NOTIFICATION_INFO_BAR_COLOR,
+            "face": face, "type": type, "rect": rect,
+            "start_time": pygame.time.get_ticks(), "alpha": 255,
             "duration": notif_duration,
             "fade_duration": config.NOTIFICATION_FADE_DURATION_MS
         }
-        if type == "success": notif["bar_color"] = config.SUCCESS_COLOR
-        elif type == "error": notif["bar_color"] = config.ERROR_COLOR
         
         self.notifications.append(notif)
-        self._recalculate_notification_positions() # Update Y positions
-        print(f"Notification: [{type.upper()}] {text}")
+        if dropped_oldest: # Everything below the dropped one moves up a slot
+            self._recalculate_notification_positions()
+        logger.info("Notification: [%s] %s", type.upper(), text)
+
+    def _render_text(self, text):
+        """Returns the rendered message, reusing recent renders of the same text."""
+        # Common messages ("Solver stopped.", ...) recur throughout a session, but some embed file
+        # names or errors and never repeat, so the cache drops its oldest entry past the cap.
+        text_surface = self._text_cache.get(text)
+        if text_surface is None:
+            text_surface = self.font.render(text, True, config.NOTIFICATION_TEXT_COLOR).convert_alpha()
+            self._text_cache[text] = text_surface
+            if len(self._text_cache) > config.NOTIFICATION_TEXT_CACHE_SIZE:
+                self._text_cache.pop(next(iter(self._text_cache)))
+        return text_surface
+
+    def _get_background_template(self, bar_color, size):
+        """Returns the rounded background with its colored left bar, drawn once per bar color."""
+        template = self._background_templates.get(bar_color)
+        if template is None:
+            template = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(template, config.NOTIFICATION_BG_COLOR, template.get_rect(), border_radius=5)
+            bar_rect = pygame.Rect(0, 0, 5, template.get_height())
+            pygame.draw.rect(template, bar_color, bar_rect, border_top_left_radius=5, border_bottom_left_radius=5)
+            self._background_templates[bar_color] = template
+        return template
 
     def _recalculate_notification_positions(self):
         padding = config.NOTIFICATION_PADDING
         bg_height = config.NOTIFICATION_HEIGHT
-        screen_width = self.screen.get_width() # Get current screen width for X pos
-        bg_width = config.NOTIFICATION_AREA_WIDTH
-
 
         for i, notif in enumerate(self.notifications):
-            notif["rect"].x = screen_width - bg_width - padding
+            notif["rect"].x = self._x
             notif["rect"].y = padding + (i * (bg_height + padding // 2))
 
 
@@ -155,9 +264,10 @@ class NotificationManager:
         pass # Placeholder for future interactions like click-to-dismiss
 
     def update(self, dt): # dt is not used here, uses pygame.time.get_ticks()
+        if not self.notifications: # The common steady state: nothing to expire or fade
+            return
         current_time = pygame.time.get_ticks()
         notifications_to_keep = []
-        changed_count = (len(self.notifications) > 0) # Assume change if there are notifications, to trigger recalc if one is removed
 
         for notif in self.notifications:
             elapsed = current_time - notif["start_time"]
@@ -167,47 +277,33 @@ class NotificationManager:
                 continue 
             
             if elapsed > notif["duration"]: # Start fading
-                fade_progress = (elapsed - notif["duration"]) / float(notif["fade_duration"])
-                notif["alpha"] = 255.0 * (1.0 - fade_progress)
-                notif["alpha"] = max(0.0, min(255.0, notif["alpha"])) # Clamp alpha
+                # Integer fade from 255 to 0; elapsed is at most duration + fade_duration here
+                notif["alpha"] = max(0, 255 - (255 * (elapsed - notif["duration"])) // notif["fade_duration"])
             
             notifications_to_keep.append(notif)
         
         if len(notifications_to_keep) != len(self.notifications): # If count actually changed
             self.notifications = notifications_to_keep
             self._recalculate_notification_positions() # Recalculate Y positions
-        elif changed_count and not self.notifications: # Went from some to none
-             self._recalculate_notification_positions() # Clear old positions effectively if needed
 
 
+    def get_dirty_rects(self):
+        if not self.notifications and not self._last_drawn_rects:
+            return []
+        current_rects = [notif["rect"].copy() for notif in self.notifications]
+        dirty_rects = current_rects + self._last_drawn_rects
+        self._last_drawn_rects = current_rects
+        return dirty_rects
+
     def draw(self, surface):
+        if not self.notifications:
+            return
+        blit_items = []
         for notif in self.notifications:
-            temp_surf = pygame.Surface(notif["rect"].size, pygame.SRCALPHA)
-            
-            bg_base_color = config.NOTIFICATION_BG_COLOR
-            # Ensure bg_base_color has an alpha component before slicing
-            base_alpha_val = bg_base_color[3] if len(bg_base_color) == 4 else 255 
-            current_alpha_bg = int(base_alpha_val * (notif["alpha"] / 255.0))
-            bg_color_with_alpha = (*bg_base_color[:3], current_alpha_bg)
-            
-            pygame.draw.rect(temp_surf, bg_color_with_alpha, temp_surf.get_rect(), border_radius=5)
-
-            bar_base_color = notif["bar_color"]
-            base_alpha_bar = bar_base_color[3] if len(bar_base_color) == 4 else 255
-            current_alpha_bar = int(base_alpha_bar * (notif["alpha"]/255.0))
-            bar_color_with_alpha = (*bar_base_color[:3], current_alpha_bar)
-
-            bar_rect = pygame.Rect(0, 0, 5, temp_surf.get_height())
-            pygame.draw.rect(temp_surf, bar_color_with_alpha, bar_rect, border_top_left_radius=5, border_bottom_left_radius=5)
-
-            text_x = bar_rect.width + config.NOTIFICATION_PADDING // 2
-            text_y = (temp_surf.get_height() - notif["text_surface"].get_height()) // 2
-            
-            notif_text_surf_copy = notif["text_surface"].copy()
-            notif_text_surf_copy.set_alpha(int(notif["alpha"])) # Text alpha matches notification alpha
-            temp_surf.blit(notif_text_surf_copy, (text_x, text_y))
-            
-            surface.blit(temp_surf, notif["rect"].topleft)
+            face = notif["face"]
+            face.set_alpha(notif["alpha"]) # Fades background, bar and text together
+            blit_items.append((face, notif["rect"].topleft))
+        surface.blits(blit_items, doreturn=False)
 
 
 class MazeVisualizerApp:
@@ -221,22 +317,39 @@ class MazeVisualizerApp:
         
         self._setup_screen() # Sets self.screen, self.screen_width, self.screen_height
 
-        pygame.display.set_caption("Pygame Maze Visualizer")
+        self._caption = "Pygame Maze Visualizer" # Last caption set on the window
+        pygame.display.set_caption(self._caption)
+        pygame.event.set_blocked(config.UNHANDLED_EVENT_TYPES)
         self.clock = pygame.time.Clock()
         self.running = True
+        self._needs_full_flip = True # Set when the whole window must be presented (resize, regen, view change)
+        self._background_rects = [] # Parts of the area above the control panel that the maze does not paint
+        self._last_active_view = None
 
         # Maze parameters
         self.maze_logical_width = cli_maze_w
         self.maze_logical_height = cli_maze_h
         self.current_solver_name = config.DEFAULT_SOLVER
+        self.current_solver_func = get_solver_function(self.current_solver_name) # Resolved on solver change, not per solve
         self.ai_solve_delay_ms = config.MAX_DELAY_MS // 2
 
         # Core components
         self.ui_manager = UIManager(self.screen)
         self.maze_display = MazeDisplay(self.screen, config.DEFAULT_CELL_SIZE)
+
+        # Control panel actions: one table feeds both the panel buttons and the keyboard shortcuts
+        self._control_actions = [
+            {"text": "Regen (R)", "key": pygame.K_r, "action": self.on_regenerate_clicked, "tooltip": "Generate a new maze"},
+            {"text": "Solve (S)", "key": pygame.K_s, "action": self.on_solve_clicked, "id": "solve_button", "tooltip": f"Solve with {self.current_solver_name}"},
+            {"text": "Battle (B)", "key": pygame.K_b, "action": self.on_battle_clicked, "tooltip": "All algorithms race to solve"},
+            {"text": "Save Img (P)", "key": pygame.K_p, "action": self.on_save_maze_clicked, "tooltip": "Save current view as PNG"},
+            {"text": "Settings (G)", "key": pygame.K_g, "action": self.on_settings_clicked, "tooltip": "Open settings panel"},
+        ]
+        # Main-view keyboard shortcuts, resolved with one dict lookup per KEYDOWN
+        self._key_actions = {b_conf["key"]: b_conf["action"] for b_conf in self._control_actions}
         
         self._setup_control_panel_elements()
-        self._setup_settings_window_instance()
+        self.settings_window_instance = None # Created the first time settings are opened
         self._generate_new_maze_and_configure_display()
 
         # Solver Time Display
@@ -254,30 +367,41 @@ class MazeVisualizerApp:
                 current_w, current_h = info.current_w, info.current_h
                 display_flags = pygame.FULLSCREEN | pygame.SCALED
             except pygame.error:
-                print("Warning: Could not get display info for fullscreen. Using provided/default size.")
+                logger.warning("Warning: Could not get display info for fullscreen. Using provided/default size.")
                 display_flags = pygame.FULLSCREEN # Fallback
         
         self.screen = pygame.display.set_mode((current_w, current_h), display_flags)
         self.screen_width = self.screen.get_width()
         self.screen_height = self.screen.get_height()
+        self._update_control_panel_rect()
         
         if hasattr(self, 'ui_manager'): # If UIManager exists (on resize)
             self.ui_manager.update_screen_reference(self.screen)
 
+    def _update_control_panel_rect(self):
+        """Rebuilds the control panel rect and its pre-rendered background; both only change with the screen size."""
+        self.control_panel_rect = pygame.Rect(0, self.screen_height - config.CONTROL_PANEL_HEIGHT,
+                                              self.screen_width, config.CONTROL_PANEL_HEIGHT)
+
+        self.control_panel_bg_surface = pygame.Surface(self.control_panel_rect.size).convert()
+        self.control_panel_bg_surface.fill(config.CONTROL_PANEL_BACKGROUND_COLOR)
+        if config.CONTROL_PANEL_BORDER_THICKNESS > 0:
+            pygame.draw.rect(self.control_panel_bg_surface, config.CONTROL_PANEL_BORDER_COLOR,
+                             self.control_panel_bg_surface.get_rect(),
+                             width=config.CONTROL_PANEL_BORDER_THICKNESS, border_radius=2)
+
     def _recalculate_layouts_on_resize(self):
         """Called after a screen resize event."""
         # Screen surface itself is recreated by Pygame on VIDEORESIZE event handling in main loop.
         # Here, we just update our stored width/height and tell components.
         self.screen_width = self.screen.get_width()
         self.screen_height = self.screen.get_height()
+        self._update_control_panel_rect()
         self.ui_manager.update_screen_reference(self.screen) # Update UIManager and its children screen refs
         
-        grid_char_w = self.maze_display.grid_render_width
-        grid_char_h = self.maze_display.grid_render_height
-        cell_size, offset_x, offset_y = self._calculate_cell_size_and_offsets(grid_char_w, grid_char_h)
-        self.maze_display.update_visual_properties(self.screen, cell_size, offset_x, offset_y)
-        
-        self._setup_control_panel_elements() # Re-creates and positions buttons
+        # Buttons are laid out left to right from the panel's top, so only their row follows the new height
+        self.ui_manager.move_control_panel_elements(self.control_panel_rect.y - self._control_panel_elements_y)
+        self._control_panel_elements_y = self.control_panel_rect.y
         
         if self.ui_manager.settings_window_instance:
             sw_instance = self.ui_manager.settings_window_instance
@@ -287,10 +411,7 @@ class MazeVisualizerApp:
                  sw_instance._setup_ui_elements()
 
         self.ui_manager.notification_manager._recalculate_notification_positions()
-
-        pygame.display.set_caption(
-             f"Maze ({self.maze_logical_width}x{self.maze_logical_height}) Cell:{cell_size}px Solver:{self.current_solver_name}"
-        )
+        self._fit_maze_to_screen()
 
 
     def _calculate_cell_size_and_offsets(self, grid_char_width, grid_char_height):
@@ -313,6 +434,24 @@ class MazeVisualizerApp:
         
         return cell_size, offset_x, offset_y
 
+    def _update_background_rects(self):
+        """Computes the margins around the maze above the control panel; only these need the background fill."""
+        viewport = pygame.Rect(0, 0, self.screen_width, max(0, self.screen_height - config.CONTROL_PANEL_HEIGHT))
+        maze_rect = self.maze_display.get_render_rect().clip(viewport)
+        maze_drawn = (self.maze_display.char_grid and
+                      self.maze_display.cell_size_px >= config.MIN_CELL_SIZE) # Same guard as MazeDisplay.draw()
+        if not maze_drawn or maze_rect.width == 0 or maze_rect.height == 0:
+            self._background_rects = [viewport]
+            return
+
+        margins = (
+            pygame.Rect(viewport.left, viewport.top, viewport.width, maze_rect.top - viewport.top),             # Above
+            pygame.Rect(viewport.left, maze_rect.bottom, viewport.width, viewport.bottom - maze_rect.bottom),   # Below
+            pygame.Rect(viewport.left, maze_rect.top, maze_rect.left - viewport.left, maze_rect.height),        # Left
+            pygame.Rect(maze_rect.right, maze_rect.top, viewport.right - maze_rect.right, maze_rect.height),    # Right
+        )
+        self._background_rects = [rect for rect in margins if rect.width > 0 and rect.height > 0]
+
     def _generate_new_maze_and_configure_display(self):
         self.maze_display.reset_solve_visuals()
         self._stop_solve_timer_display()
@@ -322,72 +461,81 @@ class MazeVisualizerApp:
             self.ui_manager.notification_manager.add_notification("Failed to generate maze!", "error")
             return
 
-        grid_char_h = len(char_grid)
-        grid_char_w = len(char_grid[0])
-        cell_size_px, offset_x, offset_y = self._calculate_cell_size_and_offsets(grid_char_w, grid_char_h)
-
         self.maze_display.set_maze(char_grid, start_node, end_node)
-        self.maze_display.update_visual_properties(self.screen, cell_size_px, offset_x, offset_y)
         self.maze_display.set_ai_solve_delay(self.ai_solve_delay_ms)
-        
-        pygame.display.set_caption(
-            f"Maze ({self.maze_logical_width}x{self.maze_logical_height}) Cell:{cell_size_px}px Solver:{self.current_solver_name}"
-        )
+        self._fit_maze_to_screen()
+
+    def _fit_maze_to_screen(self):
+        """Sizes and centers the current maze above the control panel (after regeneration or a resize)."""
+        cell_size_px, offset_x, offset_y = self._calculate_cell_size_and_offsets(
+            self.maze_display.grid_render_width, self.maze_display.grid_render_height)
+        self.maze_display.update_visual_properties(self.screen, cell_size_px, offset_x, offset_y)
+        self._update_background_rects()
+        self._needs_full_flip = True
+
+        self._update_maze_caption()
+
+    def _update_maze_caption(self):
+        # Setting the caption is a round trip to the window manager, so unchanged captions are skipped
+        caption = (f"Maze ({self.maze_logical_width}x{self.maze_logical_height}) "
+                   f"Cell:{self.maze_display.cell_size_px}px Solver:{self.current_solver_name}")
+        if caption != self._caption:
+            pygame.display.set_caption(caption)
+            self._caption = caption
 
 
     def _setup_control_panel_elements(self):
         self.ui_manager.clear_control_panel_elements()
         cp_height = config.CONTROL_PANEL_HEIGHT
         cp_y = self.screen_height - cp_height
+        self._control_panel_elements_y = cp_y
         
         btn_height = int(cp_height * 0.7)
         btn_padding_y = (cp_height - btn_height) // 2
         btn_spacing_x = 15
         current_btn_x = btn_spacing_x
 
-        buttons_config = [
-            {"text": "Regen (R)", "action": self.on_regenerate_clicked, "tooltip": "Generate a new maze"},
-            {"text": f"Solve (S)", "action": self.on_solve_clicked, "id": "solve_button", "tooltip": f"Solve with {self.current_solver_name}"},
-            {"text": "Battle (B)", "action": self.on_battle_clicked, "tooltip": "All algorithms race to solve"},
-            {"text": "Save Img (P)", "action": self.on_save_maze_clicked, "tooltip": "Save current view as PNG"},
-            {"text": "Settings (G)", "action": self.on_settings_clicked, "tooltip": "Open settings panel"},
-        ]
-        temp_font = pygame.font.Font(config.FONT_NAME, config.BUTTON_FONT_SIZE)
+        temp_font = get_font(config.FONT_NAME, config.BUTTON_FONT_SIZE)
+        self._solve_button = None # Kept for direct access when the solver changes
 
-        for b_conf in buttons_config:
+        for b_conf in self._control_actions:
             actual_text = b_conf["text"]
             if b_conf.get("id") == "solve_button": 
                 actual_text = f"Solve: {self.current_solver_name} (S)"
                 b_conf["tooltip"] = f"Solve with {self.current_solver_name} algorithm"
 
-            text_w = temp_font.render(actual_text, True, config.BUTTON_TEXT_COLOR).get_width()
+            text_w = temp_font.size(actual_text)[0] # Metrics only, no glyph rasterization
             btn_w = text_w + 2 * config.BUTTON_PADDING_X
             
             btn = Button(current_btn_x, cp_y + btn_padding_y, btn_w, btn_height, actual_text,
                          on_click_callback=b_conf["action"], tooltip=b_conf.get("tooltip"))
             if "id" in b_conf: btn.id = b_conf["id"]
+            if btn.id == "solve_button": self._solve_button = btn
             
             self.ui_manager.add_control_panel_element(btn)
             current_btn_x += btn_w + btn_spacing_x
             
         self.timer_display_label = Label(current_btn_x, cp_y + cp_height // 2, "Time: 0.00s",
                                          config.TIMER_FONT_SIZE, config.TIMER_TEXT_COLOR, alignment="left")
-        self.timer_display_label.rect.centery = cp_y + cp_height // 2
-        self.timer_display_label.rect.left = current_btn_x + btn_spacing_x 
+        timer_rect = self.timer_display_label.rect.copy()
+        timer_rect.centery = cp_y + cp_height // 2
+        timer_rect.left = current_btn_x + btn_spacing_x
+        self.timer_display_label.set_position(*timer_rect.topleft) # Moves the text along with the rect
         self.ui_manager.add_control_panel_element(self.timer_display_label)
 
     def _update_solve_button_text_and_tooltip(self):
-        for elem in self.ui_manager.control_panel_elements:
-            if hasattr(elem, 'id') and elem.id == "solve_button" and isinstance(elem, Button):
-                new_text = f"Solve: {self.current_solver_name} (S)"
-                elem.set_text(new_text) # Button's set_text should handle re-rendering
-                elem.set_tooltip(f"Solve with {self.current_solver_name} algorithm")
-                # Adjusting button width dynamically after text change can be complex
-                # For now, assume the initial width calculation is sufficient or use fixed-width buttons.
-                # If precise resizing is needed, _setup_control_panel_elements would have to be recalled.
-                break
+        if self._solve_button is None:
+            return
+        new_text = f"Solve: {self.current_solver_name} (S)"
+        self._solve_button.set_text(new_text) # Button's set_text should handle re-rendering
+        self._solve_button.set_tooltip(f"Solve with {self.current_solver_name} algorithm")
+        # Adjusting button width dynamically after text change can be complex
+        # For now, assume the initial width calculation is sufficient or use fixed-width buttons.
+        # If precise resizing is needed, _setup_control_panel_elements would have to be recalled.
 
     def _setup_settings_window_instance(self):
+        from ui.settings_window import SettingsWindow # Deferred until settings are first opened
+
         maze_params_for_settings = {"width": self.maze_logical_width, "height": self.maze_logical_height, "delay_ms": self.ai_solve_delay_ms}
         self.settings_window_instance = SettingsWindow(
             self.screen_width, self.screen_height, maze_params_for_settings, self.current_solver_name,
@@ -401,13 +549,18 @@ class MazeVisualizerApp:
         self.ui_manager.notification_manager.add_notification(f"Generated {self.maze_logical_width}x{self.maze_logical_height} maze.", "info")
 
 
+    def _stop_active_solve(self):
+        """Stops a running solve (single or battle). Returns True if one was running."""
+        if not self.maze_display.is_solving():
+            return False
+        self.maze_display.reset_solve_visuals()
+        self._stop_solve_timer_display()
+        self.ui_manager.notification_manager.add_notification("Solver stopped.", "info")
+        return True
+
     def on_solve_clicked(self):
-        if self.maze_display.is_solving():
-            self.maze_display.reset_solve_visuals()
-            self._stop_solve_timer_display()
-            self.ui_manager.notification_manager.add_notification("Solver stopped.", "info")
-        else:
-            solver_func = SOLVER_ALGORITHMS.get(self.current_solver_name)
+        if not self._stop_active_solve():
+            solver_func = self.current_solver_func
             if solver_func:
                 if self.maze_display.start_single_solve(solver_func, self.current_solver_name):
                     self._start_solve_timer_display()
@@ -418,12 +571,9 @@ class MazeVisualizerApp:
                 self.ui_manager.notification_manager.add_notification(f"Solver '{self.current_solver_name}' not found.", "error")
 
     def on_battle_clicked(self):
-        if self.maze_display.is_solving():
-            self.maze_display.reset_solve_visuals()
-            self._stop_solve_timer_display()
-            self.ui_manager.notification_manager.add_notification("Solver stopped.", "info")
-        else:
-            if self.maze_display.start_algorithm_battle(SOLVER_ALGORITHMS):
+        if not self._stop_active_solve():
+            solver_functions = {name: get_solver_function(name) for name in SOLVER_ALGORITHMS}
+            if self.maze_display.start_algorithm_battle(solver_functions):
                 self._start_solve_timer_display()
                 self.ui_manager.notification_manager.add_notification("Algorithm Battle started!", "info")
             else:
@@ -453,6 +603,8 @@ class MazeVisualizerApp:
 
 
     def on_settings_clicked(self):
+        if self.settings_window_instance is None:
+            self._setup_settings_window_instance()
         maze_params = {"width": self.maze_logical_width, "height": self.maze_logical_height, "delay_ms": self.ai_solve_delay_ms}
         self.ui_manager.show_settings(maze_params, self.current_solver_name)
 
@@ -469,6 +621,7 @@ class MazeVisualizerApp:
         self.maze_logical_height = new_maze_params["height"]
         self.ai_solve_delay_ms = new_maze_params["delay_ms"] 
         self.current_solver_name = new_solver_name
+        self.current_solver_func = get_solver_function(new_solver_name)
 
         self._update_solve_button_text_and_tooltip()
         if changed_dims: 
@@ -476,9 +629,7 @@ class MazeVisualizerApp:
             self.ui_manager.notification_manager.add_notification("Settings saved. Maze regenerated.", "success")
         else:
             self.maze_display.set_ai_solve_delay(self.ai_solve_delay_ms) 
-            pygame.display.set_caption( 
-                f"Maze ({self.maze_logical_width}x{self.maze_logical_height}) Cell:{self.maze_display.cell_size_px}px Solver:{self.current_solver_name}"
-            )
+            self._update_maze_caption()
             self.ui_manager.notification_manager.add_notification("Settings saved.", "success")
 
         self.ui_manager.hide_settings()
@@ -540,32 +691,86 @@ class MazeVisualizerApp:
             self.timer_display_label.color = config.TIMER_TEXT_COLOR
 
 
+    def _collect_dirty_rects(self):
+        """Returns the screen regions that changed this frame, or None if the whole window must be flipped."""
+        maze_changed = self.maze_display.consume_visual_changes()
+        control_panel_changed = self.ui_manager.consume_control_panel_changes()
+        notification_rects = self.ui_manager.get_notification_dirty_rects()
+
+        if self.ui_manager.active_view != self._last_active_view:
+            self._last_active_view = self.ui_manager.active_view
+            self._needs_full_flip = True # The settings overlay appeared or disappeared
+        if self._needs_full_flip:
+            self._needs_full_flip = False
+            return None
+
+        dirty_rects = list(notification_rects)
+        if control_panel_changed: # A button's hover/press state or the timer label changed
+            dirty_rects.append(self.control_panel_rect)
+        if maze_changed:
+            dirty_rects.append(self.maze_display.get_render_rect())
+        if self.ui_manager.active_view == "settings" and self.settings_window_instance:
+            dirty_rects.append(self.settings_window_instance.panel.rect)
+        return dirty_rects
+
     def run(self):
+        # Loop-invariant config values bound once as locals
+        fps = config.FPS
+        idle_wait_ms = config.IDLE_EVENT_WAIT_MS
+        resize_settle_ms = config.RESIZE_SETTLE_MS
+        ai_solve_step_event = config.AI_SOLVE_STEP_EVENT
+        app_bg_color = config.APP_BACKGROUND_COLOR
+        mouse_pos_event_types = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+        # The window contents were damaged or hidden outside the app. Frames with no flagged change
+        # skip drawing entirely, so these must force a full redraw and flip.
+        full_repaint_event_types = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                                    pygame.WINDOWRESTORED, pygame.WINDOWSHOWN)
+
+        # Mouse position is tracked from mouse events rather than queried every frame
+        mouse_pos = pygame.mouse.get_pos()
+        frame_busy = True
+        last_resize_ticks = None # Time of the latest VIDEORESIZE not yet applied to the layout
+
         while self.running:
-            dt_sec = self.clock.tick(config.FPS) / 1000.0
-            mouse_pos = pygame.mouse.get_pos()
+            if frame_busy: # Something animates or input arrived last frame: run at full frame rate
+                dt_sec = self.clock.tick(fps) / 1000.0
+                events = pygame.event.get()
+            else: # Idle: sleep in SDL until an event arrives instead of polling at a fixed rate
+                first_event = pygame.event.wait(idle_wait_ms)
+                dt_sec = self.clock.tick() / 1000.0
+                events = pygame.event.get()
+                if first_event.type != pygame.NOEVENT:
+                    events.insert(0, first_event)
+
+            if len(events) > 1: # A fast mouse queues many motions per frame; only the latest matters
+                events = coalesce_mouse_motion(events)
+
+            for event in events:
+                event_type = event.type
+                if event_type == ai_solve_step_event:
+                    # The most frequent event while solving, and no UI element reacts to it
+                    self.maze_display.handle_solve_event(event)
+                    continue
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if event_type in mouse_pos_event_types:
+                    mouse_pos = event.pos
+                elif event_type == pygame.QUIT:
                     self.running = False
-                
-                if event.type == pygame.VIDEORESIZE and not self.is_fullscreen:
-                    # Pygame already updated self.screen, just need to tell our components
-                    self._recalculate_layouts_on_resize()
-
-
-                if event.type == config.AI_SOLVE_STEP_EVENT:
-                    self.maze_display.handle_solve_event(event)
+                elif event_type in full_repaint_event_types:
+                    self._needs_full_flip = True
+                elif event_type == pygame.VIDEORESIZE and not self.is_fullscreen:
+                    # Pygame already updated self.screen; a drag emits a stream of these, so the
+                    # relayout waits until the size has settled. Until then, clear the whole window.
+                    last_resize_ticks = pygame.time.get_ticks()
+                    self._background_rects = [self.screen.get_rect()]
+                    self._needs_full_flip = True
 
                 consumed_by_ui = self.ui_manager.handle_event(event, mouse_pos)
 
-                if not consumed_by_ui and event.type == pygame.KEYDOWN:
+                if not consumed_by_ui and event_type == pygame.KEYDOWN:
                     if self.ui_manager.active_view == "main": 
-                        if event.key == pygame.K_r: self.on_regenerate_clicked()
-                        elif event.key == pygame.K_s: self.on_solve_clicked()
-                        elif event.key == pygame.K_b: self.on_battle_clicked()
-                        elif event.key == pygame.K_p: self.on_save_maze_clicked()
-                        elif event.key == pygame.K_g: self.on_settings_clicked()
+                        key_action = self._key_actions.get(event.key)
+                        if key_action: key_action()
                     
                     if event.key == pygame.K_ESCAPE:
                         if self.ui_manager.active_view == "settings":
@@ -575,25 +780,34 @@ class MazeVisualizerApp:
                         else: 
                             self.running = False
 
+            if last_resize_ticks is not None and pygame.time.get_ticks() - last_resize_ticks >= resize_settle_ms:
+                last_resize_ticks = None
+                self._recalculate_layouts_on_resize()
 
             self.ui_manager.update(dt_sec, mouse_pos)
             self._update_solve_timer_display_text()
 
-            self.screen.fill(config.APP_BACKGROUND_COLOR)
-            
-            cp_rect = pygame.Rect(0, self.screen_height - config.CONTROL_PANEL_HEIGHT,
-                                  self.screen_width, config.CONTROL_PANEL_HEIGHT)
-            pygame.draw.rect(self.screen, config.CONTROL_PANEL_BACKGROUND_COLOR, cp_rect)
-            if config.CONTROL_PANEL_BORDER_THICKNESS > 0:
-                 pygame.draw.rect(self.screen, config.CONTROL_PANEL_BORDER_COLOR, cp_rect,
-                                  width=config.CONTROL_PANEL_BORDER_THICKNESS, border_radius=2)
-
-            self.maze_display.draw()
-            self.ui_manager.draw_main_ui() 
-            self.ui_manager.draw_settings_ui() 
-            self.ui_manager.draw_notifications()
-            
-            pygame.display.flip()
+            # Every visual change is flagged by the events and updates above, so a frame where
+            # nothing changed skips both the redraw and the present.
+            dirty_rects = self._collect_dirty_rects()
+            if dirty_rects is None or dirty_rects:
+                for background_rect in self._background_rects: # The maze and control panel paint everything else
+                    self.screen.fill(app_bg_color, background_rect)
+                
+                self.screen.blit(self.control_panel_bg_surface, self.control_panel_rect)
+
+                self.maze_display.draw()
+                self.ui_manager.draw_main_ui() 
+                self.ui_manager.draw_settings_ui() 
+                self.ui_manager.draw_notifications()
+                
+                if dirty_rects is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(dirty_rects)
+
+            frame_busy = (bool(events) or last_resize_ticks is not None or
+                          self.maze_display.is_solving() or self.ui_manager.has_active_notifications())
 
         pygame.quit()
         sys.exit()
@@ -606,9 +820,12 @@ if __name__ == "__main__":
     parser.add_argument("--height", type=int, default=config.DEFAULT_HEIGHT,
                         help=f"Initial maze height (cells). Default: {config.DEFAULT_HEIGHT}")
     parser.add_argument("--fullscreen", action="store_true", help="Run in fullscreen mode")
+    parser.add_argument("--verbose", action="store_true", help="Log generator, solver and UI activity to stderr")
     
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+
     cli_maze_w = max(2, min(args.width, config.MAX_MAZE_WIDTH))
     cli_maze_h = max(2, min(args.height, config.MAX_MAZE_HEIGHT))
 
@@ -1,11 +1,14 @@
+import logging
 import random
 import config
 
+logger = logging.getLogger(__name__)
+
 # Define character representations used internally by the generator for grid cells
 # This helps decouple it from direct Pygame color drawing during generation.
 # Solvers can then also expect these characters.
-_WALL_CHAR = '#'
-_PATH_CHAR = ' '
+_WALL_CHAR = config.WALL_CHAR
+_PATH_CHAR = config.PATH_CHAR
 
 def create_maze(logical_width, logical_height):
     """
@@ -26,7 +29,7 @@ def create_maze(logical_width, logical_height):
     """
     if not (isinstance(logical_width, int) and isinstance(logical_height, int) and \
             logical_width >= 1 and logical_height >= 1):
-        print(f"Error (Maze Generator): Invalid maze dimensions. Width ({logical_width}) and Height ({logical_height}) must be integers >= 1.")
+        logger.error("Error (Maze Generator): Invalid maze dimensions. Width (%s) and Height (%s) must be integers >= 1.", logical_width, logical_height)
         return None, None, None
 
     # Calculate dimensions of the character grid
@@ -35,7 +38,7 @@ def create_maze(logical_width, logical_height):
     grid_h = 2 * logical_height + 1
 
     # Initialize grid with all walls
-    grid = [[_WALL_CHAR for _ in range(grid_w)] for _ in range(grid_h)]
+    grid = [[_WALL_CHAR] * grid_w for _ in range(grid_h)]
 
     # Stack for DFS, stores (x, y) coordinates in the character grid
     stack = []
@@ -52,41 +55,43 @@ def create_maze(logical_width, logical_height):
     grid[current_char_y][current_char_x] = _PATH_CHAR  # Mark starting cell as path
     stack.append((current_char_x, current_char_y))
 
+    # The carving loop runs once per push and pop (~2 * logical cells), so its lookups are bound to locals
+    max_char_x, max_char_y = grid_w - 1, grid_h - 1
+    choose = random.choice
+    push, pop = stack.append, stack.pop
+
     while stack:
         current_char_x, current_char_y = stack[-1]
+        current_row = grid[current_char_y]
         unvisited_neighbors = []
 
-        # Check potential neighbors (2 cells away in character grid, representing adjacent logical cells)
-        # Directions: (dx, dy) for character grid
-        # (0, -2) -> Up, (0, 2) -> Down, (-2, 0) -> Left, (2, 0) -> Right
-        for dx_char, dy_char in [(0, -2), (0, 2), (-2, 0), (2, 0)]:
-            neighbor_char_x, neighbor_char_y = current_char_x + dx_char, current_char_y + dy_char
-
-            # Check if neighbor is within grid bounds (excluding outer border, hence >0 and < grid_dim-1)
-            # And if the neighbor cell itself (the target logical cell) is still a wall (unvisited)
-            if 0 < neighbor_char_y < grid_h -1 and \
-               0 < neighbor_char_x < grid_w -1 and \
-               grid[neighbor_char_y][neighbor_char_x] == _WALL_CHAR:
-                unvisited_neighbors.append((neighbor_char_x, neighbor_char_y))
+        # Check potential neighbors (2 cells away in character grid, representing adjacent logical cells),
+        # in the order Up, Down, Left, Right. Each must lie inside the outer border and still be a wall (unvisited).
+        if current_char_y - 2 > 0 and grid[current_char_y - 2][current_char_x] == _WALL_CHAR:
+            unvisited_neighbors.append((current_char_x, current_char_y - 2))
+        if current_char_y + 2 < max_char_y and grid[current_char_y + 2][current_char_x] == _WALL_CHAR:
+            unvisited_neighbors.append((current_char_x, current_char_y + 2))
+        if current_char_x - 2 > 0 and current_row[current_char_x - 2] == _WALL_CHAR:
+            unvisited_neighbors.append((current_char_x - 2, current_char_y))
+        if current_char_x + 2 < max_char_x and current_row[current_char_x + 2] == _WALL_CHAR:
+            unvisited_neighbors.append((current_char_x + 2, current_char_y))
 
         if unvisited_neighbors:
             # Choose a random unvisited neighbor
-            next_char_x, next_char_y = random.choice(unvisited_neighbors)
+            next_char_x, next_char_y = choose(unvisited_neighbors)
 
             # Carve path to the neighbor:
             # 1. Mark the wall cell between current and neighbor as path
-            wall_to_remove_x = current_char_x + (next_char_x - current_char_x) // 2
-            wall_to_remove_y = current_char_y + (next_char_y - current_char_y) // 2
-            grid[wall_to_remove_y][wall_to_remove_x] = _PATH_CHAR
+            grid[(current_char_y + next_char_y) // 2][(current_char_x + next_char_x) // 2] = _PATH_CHAR
 
             # 2. Mark the neighbor cell itself as path
             grid[next_char_y][next_char_x] = _PATH_CHAR
 
             # Push neighbor to stack
-            stack.append((next_char_x, next_char_y))
+            push((next_char_x, next_char_y))
         else:
             # No unvisited neighbors, backtrack
-            stack.pop()
+            pop()
 
     # Create openings for start and end nodes on the outer border
     # List potential entry/exit points (cells that are paths and adjacent to border)
@@ -109,7 +114,7 @@ def create_maze(logical_width, logical_height):
         start_node_char_grid = (1, 0) # Opening above cell (1,1)
         end_node_char_grid = (1, grid_h - 1) # Opening below cell (1,1)
     elif not edge_cells_logical: # Should not happen if w,h >= 1
-        print("Warning (Maze Generator): No edge cells identified. This is unexpected.")
+        logger.warning("Warning (Maze Generator): No edge cells identified. This is unexpected.")
         # Fallback: hardcode for a small case or return error
         start_node_char_grid = (1,0)
         end_node_char_grid = (grid_w-2, grid_h-1)
@@ -139,7 +144,7 @@ def create_maze(logical_width, logical_height):
             # Right edge
             if lx == maze_logic_w - 1: return (char_grid_w - 1, 2 * ly + 1)
             # Should not be reached if lx,ly is a valid edge cell
-            print(f"Warning (Maze Generator): Could not determine opening for logical cell ({lx},{ly})")
+            logger.warning("Warning (Maze Generator): Could not determine opening for logical cell (%s,%s)", lx, ly)
             return (2 * lx + 1, 0) # Fallback
 
         start_node_char_grid = get_opening_coords(start_logical_x, start_logical_y, grid_w, grid_h, logical_width, logical_height)
@@ -161,8 +166,8 @@ def create_maze(logical_width, logical_height):
 
     # The `start_node` and `end_node` returned should be these character grid coordinates
     # because the solver will operate on this character grid.
-    print(f"Maze Generator: Dimensions logical=({logical_width}x{logical_height}), grid=({grid_w}x{grid_h})")
-    print(f"Maze Generator: Start Node (char_grid)={start_node_char_grid}, End Node (char_grid)={end_node_char_grid}")
+    logger.info("Maze Generator: Dimensions logical=(%sx%s), grid=(%sx%s)", logical_width, logical_height, grid_w, grid_h)
+    logger.info("Maze Generator: Start Node (char_grid)=%s, End Node (char_grid)=%s", start_node_char_grid, end_node_char_grid)
 
     return grid, start_node_char_grid, end_node_char_grid
 
@@ -1,9 +1,12 @@
 import heapq
-# import config # No longer needed
+import logging
+import config
 
-# Define character representations expected in the grid
-_WALL_CHAR = '#'
-_PATH_CHAR = ' '
+logger = logging.getLogger(__name__)
+
+# Character representations expected in the grid
+_WALL_CHAR = config.WALL_CHAR
+_PATH_CHAR = config.PATH_CHAR
 
 def heuristic(a, b):
     """Manhattan distance heuristic."""
@@ -11,7 +14,7 @@ def heuristic(a, b):
 
 def solve_astar_step_by_step(grid, start_node, end_node):
     if not grid or not grid[0]:
-        print("Solver Error (A*): Grid is empty or invalid.")
+        logger.error("Solver Error (A*): Grid is empty or invalid.")
         yield set(), [], True, None
         return
 
@@ -19,15 +22,15 @@ def solve_astar_step_by_step(grid, start_node, end_node):
     w = len(grid[0])
 
     if not (0 <= start_node[1] < h and 0 <= start_node[0] < w and grid[start_node[1]][start_node[0]] == _PATH_CHAR):
-        print(f"Solver Error (A*): Invalid start node {start_node} or it's a wall (expected '{_PATH_CHAR}').")
+        logger.error("Solver Error (A*): Invalid start node %s or it's a wall (expected '%s').", start_node, _PATH_CHAR)
         yield set(), [], True, None
         return
     if not (0 <= end_node[1] < h and 0 <= end_node[0] < w and grid[end_node[1]][end_node[0]] == _PATH_CHAR):
-        print(f"Solver Error (A*): Invalid end node {end_node} or it's a wall (expected '{_PATH_CHAR}').")
+        logger.error("Solver Error (A*): Invalid end node %s or it's a wall (expected '%s').", end_node, _PATH_CHAR)
         yield set(), [], True, None
         return
 
-    print(f"Solver (A*): Starting search from {start_node} to {end_node} on a {w}x{h} grid.")
+    logger.info("Solver (A*): Starting search from %s to %s on a %sx%s grid.", start_node, end_node, w, h)
 
     open_set_heap = []
     g_cost_start = 0
@@ -37,8 +40,9 @@ def solve_astar_step_by_step(grid, start_node, end_node):
 
     g_costs = {start_node: 0}
     nodes_considered_for_vis = {start_node}
+    # Yielded live rather than copied per step; the display only reads it between steps
 
-    yield nodes_considered_for_vis.copy(), [start_node], False, None 
+    yield nodes_considered_for_vis, [start_node], False, None 
 
     while open_set_heap:
         f_cost, current_g_cost, current_node, current_path_segment = heapq.heappop(open_set_heap)
@@ -46,11 +50,11 @@ def solve_astar_step_by_step(grid, start_node, end_node):
         if current_g_cost > g_costs.get(current_node, float('inf')):
             continue
         
-        yield nodes_considered_for_vis.copy(), list(current_path_segment), False, None
+        yield nodes_considered_for_vis, current_path_segment, False, None
 
         if current_node == end_node:
-            print(f"Solver (A*): Path found to {end_node}. Cost: {current_g_cost}, Length: {len(current_path_segment)}")
-            yield nodes_considered_for_vis.copy(), list(current_path_segment), True, list(current_path_segment)
+            logger.info("Solver (A*): Path found to %s. Cost: %s, Length: %s", end_node, current_g_cost, len(current_path_segment))
+            yield nodes_considered_for_vis, list(current_path_segment), True, list(current_path_segment)
             return
 
         cx, cy = current_node
@@ -72,5 +76,5 @@ def solve_astar_step_by_step(grid, start_node, end_node):
                     heapq.heappush(open_set_heap, (f_cost_neighbor, tentative_g_cost, neighbor_node, new_path_segment))
                     nodes_considered_for_vis.add(neighbor_node) 
 
-    print(f"Solver (A*): No path found from {start_node} to {end_node} after considering {len(nodes_considered_for_vis)} nodes.")
-    yield nodes_considered_for_vis.copy(), [], True, None
\ No newline at end of file
+    logger.info("Solver (A*): No path found from %s to %s after considering %s nodes.", start_node, end_node, len(nodes_considered_for_vis))
+    yield nodes_considered_for_vis, [], True, None
\ No newline at end of file
@@ -1,10 +1,15 @@
-# Define character representations expected in the grid
-_WALL_CHAR = '#'
-_PATH_CHAR = ' '
+import logging
+import config
+
+logger = logging.getLogger(__name__)
+
+# Character representations expected in the grid
+_WALL_CHAR = config.WALL_CHAR
+_PATH_CHAR = config.PATH_CHAR
 
 def solve_dfs_step_by_step(grid, start_node, end_node):
     if not grid or not grid[0]:
-        print("Solver Error (DFS): Grid is empty or invalid.")
+        logger.error("Solver Error (DFS): Grid is empty or invalid.")
         yield set(), [], True, None
         return
 
@@ -12,27 +17,28 @@ def solve_dfs_step_by_step(grid, start_node, end_node):
     w = len(grid[0])
 
     if not (0 <= start_node[1] < h and 0 <= start_node[0] < w and grid[start_node[1]][start_node[0]] == _PATH_CHAR):
-        print(f"Solver Error (DFS): Invalid start node {start_node} or it's a wall (expected '{_PATH_CHAR}').")
+        logger.error("Solver Error (DFS): Invalid start node %s or it's a wall (expected '%s').", start_node, _PATH_CHAR)
         yield set(), [], True, None
         return
     if not (0 <= end_node[1] < h and 0 <= end_node[0] < w and grid[end_node[1]][end_node[0]] == _PATH_CHAR):
-        print(f"Solver Error (DFS): Invalid end node {end_node} or it's a wall (expected '{_PATH_CHAR}').")
+        logger.error("Solver Error (DFS): Invalid end node %s or it's a wall (expected '%s').", end_node, _PATH_CHAR)
         yield set(), [], True, None
         return
 
-    print(f"Solver (DFS): Starting search from {start_node} to {end_node} on a {w}x{h} grid.")
+    logger.info("Solver (DFS): Starting search from %s to %s on a %sx%s grid.", start_node, end_node, w, h)
 
     stack = [(start_node, [start_node])]  
     visited = {start_node}
+    # Yielded live rather than copied per step; the display only reads it between steps
 
-    yield visited.copy(), [start_node], False, None 
+    yield visited, [start_node], False, None 
 
     while stack:
         (cx, cy), current_path_segment = stack[-1] 
 
         if (cx, cy) == end_node:
-            print(f"Solver (DFS): Path found to {end_node}. Length: {len(current_path_segment)}")
-            yield visited.copy(), list(current_path_segment), True, list(current_path_segment)
+            logger.info("Solver (DFS): Path found to %s. Length: %s", end_node, len(current_path_segment))
+            yield visited, list(current_path_segment), True, list(current_path_segment)
             return
 
         found_next_unvisited_neighbor = False
@@ -47,7 +53,7 @@ def solve_dfs_step_by_step(grid, start_node, end_node):
                     new_path_segment.append(neighbor_node)
                     stack.append((neighbor_node, new_path_segment))
                     
-                    yield visited.copy(), list(new_path_segment), False, None 
+                    yield visited, new_path_segment, False, None 
                     found_next_unvisited_neighbor = True
                     break 
 
@@ -55,7 +61,7 @@ def solve_dfs_step_by_step(grid, start_node, end_node):
             popped_node, popped_path = stack.pop()
             if stack: 
                 _, path_at_top = stack[-1]
-                yield visited.copy(), list(path_at_top), False, None
+                yield visited, path_at_top, False, None
             
-    print(f"Solver (DFS): No path found from {start_node} to {end_node} after visiting {len(visited)} nodes.")
-    yield visited.copy(), [], True, None
\ No newline at end of file
+    logger.info("Solver (DFS): No path found from %s to %s after visiting %s nodes.", start_node, end_node, len(visited))
+    yield visited, [], True, None
\ No newline at end of file
@@ -1,9 +1,15 @@
+import logging
+import re
 import pygame
 import config
 
-# Character representations from maze_generator (consistency)
-_WALL_CHAR = '#'
-_PATH_CHAR = ' '
+logger = logging.getLogger(__name__)
+
+# Character representations shared with maze_generator and the solvers
+_WALL_CHAR = config.WALL_CHAR
+_PATH_CHAR = config.PATH_CHAR
+# Horizontal runs of non-wall cells in a grid row, each painted with a single fill
+_PATH_RUN_RE = re.compile("[^" + re.escape(_WALL_CHAR) + "]+")
 
 class MazeDisplay:
     def __init__(self, screen, cell_size_px, offset_x=0, offset_y=0):
@@ -29,6 +35,10 @@ class MazeDisplay:
         # Pre-render static parts of the maze if possible (optimization)
         self._static_maze_surface = None
         self._maze_surface_dirty = True # Flag to re-render static maze part
+        # Static maze with the solver overlays composited on top, rebuilt only when a solver state changes
+        self._composited_surface = None
+        self._overlays_dirty = True
+        self._visuals_changed = True # Anything drawn by draw() changed since last consume_visual_changes()
 
     def set_maze(self, char_grid, start_node_coords, end_node_coords):
         """Sets a new maze to display."""
@@ -45,33 +55,44 @@ class MazeDisplay:
         
         self.reset_solve_visuals() # Clear solver paths, visited sets
         self._maze_surface_dirty = True # Maze structure changed, needs full redraw
+        self._visuals_changed = True
 
     def update_visual_properties(self, screen, cell_size_px, offset_x, offset_y):
         """Updates display properties like screen, cell size, or offset."""
-        needs_redraw = False
-        if self.screen != screen:
-            self.screen = screen
-            needs_redraw = True
+        # The cached maze surface is drawn at its own origin and only blitted at the offset,
+        # so only a cell size change invalidates it; screen/offset changes just move the blit.
+        self.screen = screen
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self._visuals_changed = True
         if self.cell_size_px != cell_size_px:
             self.cell_size_px = cell_size_px
-            needs_redraw = True
-        if self.offset_x != offset_x or self.offset_y != offset_y:
-            self.offset_x = offset_x
-            self.offset_y = offset_y
-            needs_redraw = True
-        
-        if needs_redraw:
             self._maze_surface_dirty = True # Force re-render of static part
 
     def set_ai_solve_delay(self, delay_ms):
-        self._solve_delay_ms = max(config.MIN_DELAY_MS, min(delay_ms, config.MAX_DELAY_MS))
-        print(f"MazeDisplay: AI solve delay set to {self._solve_delay_ms} ms")
+        delay_ms = max(config.MIN_DELAY_MS, min(delay_ms, config.MAX_DELAY_MS))
+        if delay_ms == self._solve_delay_ms:
+            return # Re-arming the timer would restart the countdown to the next step for nothing
+        self._solve_delay_ms = delay_ms
+        logger.info("MazeDisplay: AI solve delay set to %s ms", self._solve_delay_ms)
         if self.is_solving(): # If actively solving, re-set the timer
             pygame.time.set_timer(config.AI_SOLVE_STEP_EVENT, self._solve_delay_ms)
 
     def get_ai_solve_delay(self):
         return self._solve_delay_ms
 
+    def get_render_rect(self):
+        """Returns the screen-space Rect covered by the maze."""
+        return pygame.Rect(self.offset_x, self.offset_y,
+                           self.grid_render_width * self.cell_size_px,
+                           self.grid_render_height * self.cell_size_px)
+
+    def consume_visual_changes(self):
+        """Returns True if the maze area needs repainting since the last call, and clears the flag."""
+        changed = self._visuals_changed
+        self._visuals_changed = False
+        return changed
+
     def is_solving(self):
         return bool(self._active_solver_names)
 
@@ -82,12 +103,14 @@ class MazeDisplay:
         self._active_solver_names = set()
         self._is_battle_mode = False
         self._current_single_solver_name = config.DEFAULT_SOLVER
+        self._overlays_dirty = True
+        self._visuals_changed = True
         # self._maze_surface_dirty remains true if set_maze called it, false otherwise.
         # This function doesn't inherently make the static maze dirty.
 
     def start_single_solve(self, solver_function, solver_name):
         if self.is_solving():
-            print("MazeDisplay: Solve requested, but already solving.")
+            logger.info("MazeDisplay: Solve requested, but already solving.")
             return False # Indicate failure to start
         if not self._is_maze_ready_for_solve():
             return False
@@ -100,23 +123,23 @@ class MazeDisplay:
         try:
             generator = solver_function(self.char_grid, self.start_node_coords, self.end_node_coords)
             self._solver_states[solver_name] = self._create_empty_solver_state(generator)
-            print(f"MazeDisplay: Starting single AI solve ({solver_name}), Delay: {self._solve_delay_ms}ms")
+            logger.info("MazeDisplay: Starting single AI solve (%s), Delay: %sms", solver_name, self._solve_delay_ms)
             self._ai_solve_step_for_solver(solver_name) # Initial step
             pygame.time.set_timer(config.AI_SOLVE_STEP_EVENT, self._solve_delay_ms)
             return True
         except Exception as e:
-            print(f"MazeDisplay: Error initializing solver '{solver_name}': {e}")
+            logger.error("MazeDisplay: Error initializing solver '%s': %s", solver_name, e)
             self.reset_solve_visuals()
             return False
 
     def start_algorithm_battle(self, solver_functions_map):
         if self.is_solving():
-            print("MazeDisplay: Algorithm Battle requested, but already solving.")
+            logger.info("MazeDisplay: Algorithm Battle requested, but already solving.")
             return False
         if not self._is_maze_ready_for_solve():
             return False
         if not solver_functions_map or not isinstance(solver_functions_map, dict):
-            print("MazeDisplay: Invalid solver_functions_map for Algorithm Battle.")
+            logger.warning("MazeDisplay: Invalid solver_functions_map for Algorithm Battle.")
             return False
 
         self.reset_solve_visuals()
@@ -132,28 +155,29 @@ class MazeDisplay:
                     self._ai_solve_step_for_solver(name) # Initial step for each
                     valid_solvers_started +=1
                 except Exception as e:
-                    print(f"MazeDisplay: Error initializing solver '{name}' for battle: {e}")
+                    logger.error("MazeDisplay: Error initializing solver '%s' for battle: %s", name, e)
             else:
-                print(f"MazeDisplay: Solver function for '{name}' is not callable. Skipping.")
+                logger.warning("MazeDisplay: Solver function for '%s' is not callable. Skipping.", name)
         
         if valid_solvers_started == 0:
-            print("MazeDisplay: No valid solvers started for Algorithm Battle. Stopping.")
+            logger.info("MazeDisplay: No valid solvers started for Algorithm Battle. Stopping.")
             self.reset_solve_visuals()
             return False
 
-        print(f"MazeDisplay: Starting Algorithm Battle for {list(self._active_solver_names)}, Delay: {self._solve_delay_ms}ms")
+        logger.info("MazeDisplay: Starting Algorithm Battle for %s, Delay: %sms", list(self._active_solver_names), self._solve_delay_ms)
         pygame.time.set_timer(config.AI_SOLVE_STEP_EVENT, self._solve_delay_ms)
         return True
 
     def _is_maze_ready_for_solve(self):
         if not self.char_grid or self.start_node_coords is None or self.end_node_coords is None:
-            print("MazeDisplay: Cannot start AI solve - maze, start, or end node not set.")
+            logger.warning("MazeDisplay: Cannot start AI solve - maze, start, or end node not set.")
             return False
         return True
 
     def _create_empty_solver_state(self, generator):
         return {
             "generator": generator,
+            "advance": generator.__next__, # Bound once; called on every solver step
             "visited_coords": set(),    # Set of (x,y) tuples
             "current_path_coords": [],  # List of (x,y) tuples
             "final_path_coords": None,  # List of (x,y) tuples, or None
@@ -173,7 +197,7 @@ class MazeDisplay:
                     self._ai_solve_step_for_solver(solver_name)
             
             if not self.is_solving(): # If all solvers finished
-                print("MazeDisplay: All active solvers have finished.")
+                logger.info("MazeDisplay: All active solvers have finished.")
                 self.stop_ai_solve_timer()
                 # Battle mode might have a "winner" determination here if needed
 
@@ -182,10 +206,13 @@ class MazeDisplay:
         if not state or state["is_done"] or not state["generator"]:
             self._active_solver_names.discard(solver_name)
             return
+        self._overlays_dirty = True
+        self._visuals_changed = True
 
         try:
             # Expected yield: visited_coords_set, current_path_list, is_done_bool, final_path_list_or_none
-            visited, current_segment, is_done, final_path = next(state["generator"])
+            # The visited set and path are the solver's live objects: read them, never mutate them.
+            visited, current_segment, is_done, final_path = state["advance"]()
 
             state["visited_coords"] = visited if visited else set()
             state["current_path_coords"] = current_segment if current_segment else []
@@ -194,18 +221,18 @@ class MazeDisplay:
             if is_done:
                 state["final_path_coords"] = final_path
                 state["found_path"] = bool(final_path)
-                print(f"MazeDisplay: Solver '{solver_name}' finished. Path found: {state['found_path']}")
+                logger.info("MazeDisplay: Solver '%s' finished. Path found: %s", solver_name, state['found_path'])
                 self._active_solver_names.discard(solver_name)
         
         except StopIteration:
-            print(f"MazeDisplay: Solver generator for '{solver_name}' finished (StopIteration).")
+            logger.info("MazeDisplay: Solver generator for '%s' finished (StopIteration).", solver_name)
             state["is_done"] = True
             if not state["final_path_coords"]: # If StopIteration and no path explicitly yielded
                  state["found_path"] = False
-                 print(f"   ({solver_name}: No final path was yielded prior to StopIteration)")
+                 logger.info("   (%s: No final path was yielded prior to StopIteration)", solver_name)
             self._active_solver_names.discard(solver_name)
         except Exception as e:
-            print(f"MazeDisplay: Error during AI solve step for '{solver_name}': {e}")
+            logger.error("MazeDisplay: Error during AI solve step for '%s': %s", solver_name, e)
             import traceback
             traceback.print_exc()
             state["is_done"] = True # Mark as done to prevent further errors
@@ -219,25 +246,38 @@ class MazeDisplay:
 
         surface_width = self.grid_render_width * self.cell_size_px
         surface_height = self.grid_render_height * self.cell_size_px
-        self._static_maze_surface = pygame.Surface((surface_width, surface_height))
+        # convert() to the display's pixel format so the per-frame blit is a straight copy
+        self._static_maze_surface = pygame.Surface((surface_width, surface_height)).convert()
         self._static_maze_surface.fill(config.MAZE_BACKGROUND_COLOR) # Fallback bg
-
-        for r_idx, row in enumerate(self.char_grid):
-            for c_idx, cell_char in enumerate(row):
-                cell_rect = pygame.Rect(c_idx * self.cell_size_px, r_idx * self.cell_size_px,
-                                        self.cell_size_px, self.cell_size_px)
-                color = config.WALL_COLOR if cell_char == _WALL_CHAR else config.PATH_COLOR
-                
-                # Special colors for start/end, drawn on top of path/wall if they are openings
-                if (c_idx, r_idx) == self.start_node_coords:
-                    color = config.START_NODE_COLOR
-                elif (c_idx, r_idx) == self.end_node_coords:
-                    color = config.END_NODE_COLOR
-                
-                pygame.draw.rect(self._static_maze_surface, color, cell_rect)
+        self._fill_maze_cells(self._static_maze_surface, 0, 0)
         
         self._maze_surface_dirty = False
-        print("MazeDisplay: Static maze surface re-rendered.")
+        self._overlays_dirty = True # The composited copy is built from the old static surface
+        logger.info("MazeDisplay: Static maze surface re-rendered.")
+
+    def _fill_maze_cells(self, surface, origin_x, origin_y):
+        """Fills every maze cell onto `surface`, with the grid's top-left corner at (origin_x, origin_y)."""
+        # Map colors to the target's pixel format once, so each cell fill skips color parsing
+        wall_pixel = surface.map_rgb(config.WALL_COLOR)
+        path_pixel = surface.map_rgb(config.PATH_COLOR)
+        cell_px = self.cell_size_px
+
+        # One wall-colored fill for the whole grid, then one fill per horizontal run of path cells
+        surface.fill(wall_pixel, (origin_x, origin_y,
+                                  self.grid_render_width * cell_px, self.grid_render_height * cell_px))
+        for r_idx, row in enumerate(self.char_grid):
+            draw_y = origin_y + r_idx * cell_px
+            for run in _PATH_RUN_RE.finditer("".join(row)):
+                run_start, run_end = run.span()
+                surface.fill(path_pixel, (origin_x + run_start * cell_px, draw_y,
+                                          (run_end - run_start) * cell_px, cell_px))
+
+        # Special colors for start/end, drawn on top of path/wall if they are openings
+        for node, color in ((self.start_node_coords, config.START_NODE_COLOR),
+                            (self.end_node_coords, config.END_NODE_COLOR)):
+            if node is not None:
+                surface.fill(surface.map_rgb(color),
+                             (origin_x + node[0] * cell_px, origin_y + node[1] * cell_px, cell_px, cell_px))
 
     def draw(self):
         if not self.char_grid or self.cell_size_px < config.MIN_CELL_SIZE:
@@ -247,30 +287,33 @@ class MazeDisplay:
         if self._maze_surface_dirty or self._static_maze_surface is None:
             self._draw_static_maze()
 
-        if self._static_maze_surface:
-            self.screen.blit(self._static_maze_surface, (self.offset_x, self.offset_y))
-        else: # Fallback if static surface failed (e.g. too small cell size)
+        if self._static_maze_surface is None: # Fallback if static surface failed (e.g. too small cell size)
             # Draw manually (less efficient)
-            for r_idx, row in enumerate(self.char_grid):
-                for c_idx, cell_char in enumerate(row):
-                    draw_x = self.offset_x + c_idx * self.cell_size_px
-                    draw_y = self.offset_y + r_idx * self.cell_size_px
-                    cell_rect = pygame.Rect(draw_x, draw_y, self.cell_size_px, self.cell_size_px)
-                    color = config.WALL_COLOR if cell_char == _WALL_CHAR else config.PATH_COLOR
-                    if (c_idx, r_idx) == self.start_node_coords: color = config.START_NODE_COLOR
-                    elif (c_idx, r_idx) == self.end_node_coords: color = config.END_NODE_COLOR
-                    pygame.draw.rect(self.screen, color, cell_rect)
-
-
-        # --- Draw Solver Visualizations (dynamic part) ---
-        # These are drawn on top of the static maze surface
-        # Create a temporary surface for alpha blending solver paths to avoid re-drawing base maze
-        solver_overlay_width = self.grid_render_width * self.cell_size_px
-        solver_overlay_height = self.grid_render_height * self.cell_size_px
+            self._fill_maze_cells(self.screen, self.offset_x, self.offset_y)
+            self._draw_solver_overlays(self.screen, self.offset_x, self.offset_y)
+            return
 
         # Optimization: if no solvers active and no final paths, skip overlay
-        if not self._solver_states: return
+        if not self._solver_states:
+            self.screen.blit(self._static_maze_surface, (self.offset_x, self.offset_y))
+            return
+
+        # --- Solver Visualizations (dynamic part) ---
+        # Composited onto a copy of the static maze only when a solver state changed, so frames
+        # between solver steps (and after a solve finishes) cost a single blit.
+        if self._overlays_dirty or self._composited_surface is None:
+            if (self._composited_surface is None or
+                    self._composited_surface.get_size() != self._static_maze_surface.get_size()):
+                self._composited_surface = self._static_maze_surface.copy()
+            else:
+                self._composited_surface.blit(self._static_maze_surface, (0, 0))
+            self._draw_solver_overlays(self._composited_surface, 0, 0)
+            self._overlays_dirty = False
+
+        self.screen.blit(self._composited_surface, (self.offset_x, self.offset_y))
 
+    def _draw_solver_overlays(self, surface, origin_x, origin_y):
+        """Draws every solver's visited cells, current path and final path onto surface at the maze origin."""
         # Draw visited cells first, then current paths, then final paths
         # Order matters for battle mode visibility.
         
@@ -278,59 +321,56 @@ class MazeDisplay:
         for solver_name, state_data in self._solver_states.items():
             if not state_data or not state_data.get("visited_coords"): continue
             
-            solver_theme = config.SOLVER_COLORS.get(solver_name, config.SOLVER_COLORS["DEFAULT"])
-            visited_color = solver_theme["visited"] # Expected (R, G, B, A)
+            visited_color = config.get_solver_color(solver_name, "visited") # Expected (R, G, B, A)
 
-            for c_idx, r_idx in state_data["visited_coords"]:
-                if (c_idx, r_idx) == self.start_node_coords or (c_idx, r_idx) == self.end_node_coords:
-                    continue # Don't obscure start/end nodes with visited markers
-                
-                self._draw_solver_cell_overlay(c_idx, r_idx, visited_color, config.VISITED_CELL_SCALE)
+            self._draw_solver_cells_overlay(surface, origin_x, origin_y, state_data["visited_coords"],
+                                            visited_color, config.VISITED_CELL_SCALE)
 
         # 2. Draw current path segments (medium emphasis)
         for solver_name, state_data in self._solver_states.items():
             if not state_data or not state_data.get("current_path_coords") or state_data.get("is_done"):
                 continue # Don't draw current path if done (final path will be shown)
 
-            solver_theme = config.SOLVER_COLORS.get(solver_name, config.SOLVER_COLORS["DEFAULT"])
-            current_path_color = solver_theme["path"] # Expected (R, G, B, A)
+            current_path_color = config.get_solver_color(solver_name, "path") # Expected (R, G, B, A)
 
-            for c_idx, r_idx in state_data["current_path_coords"]:
-                if (c_idx, r_idx) == self.start_node_coords or (c_idx, r_idx) == self.end_node_coords:
-                    continue
-                self._draw_solver_cell_overlay(c_idx, r_idx, current_path_color, config.CURRENT_PATH_CELL_SCALE)
+            self._draw_solver_cells_overlay(surface, origin_x, origin_y, state_data["current_path_coords"],
+                                            current_path_color, config.CURRENT_PATH_CELL_SCALE)
         
         # 3. Draw final paths (strongest emphasis)
         for solver_name, state_data in self._solver_states.items():
             if not state_data or not state_data.get("final_path_coords"): continue
 
-            solver_theme = config.SOLVER_COLORS.get(solver_name, config.SOLVER_COLORS["DEFAULT"])
             # Final path color usually has no alpha or full alpha, drawn solid
-            final_path_color = solver_theme["final_path"] # Expected (R, G, B) or (R,G,B,A)
+            final_path_color = config.get_solver_color(solver_name, "final_path") # Expected (R, G, B) or (R,G,B,A)
 
-            for c_idx, r_idx in state_data["final_path_coords"]:
-                if (c_idx, r_idx) == self.start_node_coords or (c_idx, r_idx) == self.end_node_coords:
-                    continue
-                self._draw_solver_cell_overlay(c_idx, r_idx, final_path_color, config.FINAL_PATH_CELL_SCALE)
+            self._draw_solver_cells_overlay(surface, origin_x, origin_y, state_data["final_path_coords"],
+                                            final_path_color, config.FINAL_PATH_CELL_SCALE)
 
 
-    def _draw_solver_cell_overlay(self, c_idx, r_idx, color_tuple, scale_factor):
-        """Helper to draw a scaled, centered rectangle for solver visualization."""
+    def _draw_solver_cells_overlay(self, surface, origin_x, origin_y, coords, color_tuple, scale_factor):
+        """Draws a scaled, centered rectangle on surface for each solver cell in `coords` (start/end nodes are skipped)."""
+        # Everything that is constant for the pass is bound to locals once, not looked up per cell
         full_size = self.cell_size_px
         scaled_size = int(full_size * scale_factor)
         if scaled_size < 1: scaled_size = 1 # Ensure at least 1 pixel
 
-        offset = (full_size - scaled_size) // 2
-        
-        draw_x = self.offset_x + (c_idx * full_size) + offset
-        draw_y = self.offset_y + (r_idx * full_size) + offset
-        
-        overlay_rect = pygame.Rect(draw_x, draw_y, scaled_size, scaled_size)
+        inset = (full_size - scaled_size) // 2
+        base_x = origin_x + inset
+        base_y = origin_y + inset
+        start_node, end_node = self.start_node_coords, self.end_node_coords
 
-        # If color has alpha, use a surface for proper blending
         if len(color_tuple) == 4:
-            temp_surface = pygame.Surface((scaled_size, scaled_size), pygame.SRCALPHA)
-            temp_surface.fill(color_tuple)
-            self.screen.blit(temp_surface, overlay_rect.topleft)
+            # Color has alpha: blend one pre-filled tile per cell instead of allocating a surface each time
+            tile = pygame.Surface((scaled_size, scaled_size), pygame.SRCALPHA).convert_alpha()
+            tile.fill(color_tuple)
+            # Every tile goes to pygame in a single blits() call rather than one blit() per cell
+            surface.blits(((tile, (base_x + cell[0] * full_size, base_y + cell[1] * full_size))
+                           for cell in coords
+                           if cell != start_node and cell != end_node), # Don't obscure start/end nodes
+                          doreturn=False)
         else: # Solid color
-            pygame.draw.rect(self.screen, color_tuple, overlay_rect)
\ No newline at end of file
+            fill = surface.fill
+            for cell in coords:
+                if cell == start_node or cell == end_node:
+                    continue
+                fill(color_tuple, (base_x + cell[0] * full_size, base_y + cell[1] * full_size, scaled_size, scaled_size))
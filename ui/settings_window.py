@@ -1,7 +1,10 @@
+import logging
 import pygame
 import config
 from .ui_elements import Panel, Label, Button, InputBox, Slider
 
+logger = logging.getLogger(__name__)
+
 class SettingsWindow:
     """
     A modal window for changing application settings like maze dimensions,
@@ -46,6 +49,8 @@ class SettingsWindow:
         self.elements = [] # All UI elements go here for easy event handling and drawing
         self._setup_ui_elements()
 
+        self._overlay_surface = None # Cached modal overlay, rebuilt only when the screen size changes
+
         self.visible = False # The window is hidden by default
 
     def _map_delay_to_slider(self, delay_ms):
@@ -66,18 +71,10 @@ class SettingsWindow:
         return int(max(min_slider, min(round(slider_value), max_slider)))
 
     def _map_slider_to_delay(self, slider_value):
-        """Converts a slider value (0-100) to AI step delay (ms)."""
-        min_delay, max_delay = config.MIN_DELAY_MS, config.MAX_DELAY_MS
-        min_slider, max_slider = config.SLIDER_MIN_VAL, config.SLIDER_MAX_VAL
-        exponent = config.SLIDER_EXPONENT
-
-        if max_slider == min_slider: return min_delay
-        
-        ratio = (float(slider_value) - min_slider) / (max_slider - min_slider)
-        mapped_ratio_for_delay = (1.0 - ratio) ** exponent
-        delay = min_delay + mapped_ratio_for_delay * (max_delay - min_delay)
-        
-        return int(max(min_delay, min(delay, max_delay)))
+        """Converts a slider value (0-100) to AI step delay (ms) via the precomputed lookup table."""
+        index = int(slider_value) - config.SLIDER_MIN_VAL
+        index = max(0, min(index, len(config.SLIDER_DELAY_LUT) - 1))
+        return config.SLIDER_DELAY_LUT[index]
 
     def _validate_dimension(self, text_value, min_val, max_val):
         """Validates if a text value is an integer within a given range."""
@@ -195,6 +192,7 @@ class SettingsWindow:
         self.elements.append(self.cancel_button)
         
         self._force_validate_inputs_and_update_save_button()
+        self._laid_out_at = self.panel.rect.topleft # Where the elements were placed; see show()
 
     def _on_speed_slider_changed(self, slider_value):
         """Callback when the speed slider's value changes."""
@@ -218,7 +216,7 @@ class SettingsWindow:
             # For simplicity, directly setting colors and forcing an update
             btn.colors["normal"] = config.CHOICE_BOX_SELECTED_COLOR if is_selected else config.CHOICE_BOX_NORMAL_COLOR
             btn.text_color_normal = config.CHOICE_BOX_SELECTED_TEXT_COLOR if is_selected else config.CHOICE_BOX_TEXT_COLOR
-            btn.colors["hover"] = pygame.Color(btn.colors["normal"]).lerp(pygame.Color("white"), 0.15) # type: ignore
+            btn.colors["hover"] = config.CHOICE_BOX_SELECTED_HOVER_COLOR if is_selected else config.CHOICE_BOX_NORMAL_HOVER_COLOR
             btn._update_visual_state() # To apply color changes
 
     def _force_validate_inputs_and_update_save_button(self):
@@ -278,7 +276,7 @@ class SettingsWindow:
             self.hide()
         else:
             # Optionally, provide feedback if save is attempted while disabled
-            print("Settings: Save button clicked, but inputs are invalid or no changes.")
+            logger.info("Settings: Save button clicked, but inputs are invalid or no changes.")
 
 
     def _trigger_cancel(self):
@@ -298,7 +296,12 @@ class SettingsWindow:
         self.initial_maze_params = current_maze_params.copy()
         self.initial_solver_name = current_solver_name
         self.current_working_maze_params = current_maze_params.copy()
-        self.current_working_solver = current_solver_name
+        # Fall back to the default if the app hands us a solver the window has no button for
+        self.current_working_solver = current_solver_name if current_solver_name in config.SOLVER_OPTIONS_SET else config.DEFAULT_SOLVER
+
+        # The window is built once and reused; its elements are only rebuilt if a resize moved the panel
+        if self.panel.rect.topleft != self._laid_out_at:
+            self._setup_ui_elements()
         
         # Reset UI elements to reflect these states
         self.width_input.set_value(str(self.current_working_maze_params["width"]), trigger_validation=False)
@@ -349,15 +352,21 @@ class SettingsWindow:
         for element in self.elements:
             element.update(dt, mouse_pos)
 
+    def _get_overlay_surface(self):
+        """Returns the dark, semi-transparent modal overlay, allocating it only when the screen size changed."""
+        size = (self.screen_width, self.screen_height)
+        if self._overlay_surface is None or self._overlay_surface.get_size() != size:
+            self._overlay_surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            self._overlay_surface.fill((0, 0, 0, 180)) # Dark, semi-transparent
+        return self._overlay_surface
+
     def draw(self, screen):
         """Draws the settings window and its elements onto the provided surface."""
         if not self.visible:
             return
 
         # Draw a semi-transparent overlay for modal effect
-        overlay_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay_surface.fill((0, 0, 0, 180)) # Dark, semi-transparent
-        screen.blit(overlay_surface, (0, 0))
+        screen.blit(self._get_overlay_surface(), (0, 0))
 
         self.panel.draw(screen) # Draw panel background and border
         for element in self.elements: # Draw all child UI elements
@@ -2,13 +2,44 @@ import pygame
 import config
 import math
 
+# Font objects shared across element instances, keyed by (font_name, font_size).
+# Loading a font reads and parses the font file, so every element of a given size reuses one object.
+_FONT_CACHE = {}
+
+def get_font(font_name, font_size):
+    """Returns a shared pygame Font for (font_name, font_size), loading it on first use."""
+    key = (font_name, font_size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = pygame.font.Font(font_name, font_size)
+        _FONT_CACHE[key] = font
+    return font
+
 # Helper function for text rendering
 def render_text(text, font_size, color, font_name=None, antialias=True):
     """Renders text and returns the surface and its rect."""
-    font = pygame.font.Font(font_name or config.FONT_NAME, font_size)
+    font = get_font(font_name or config.FONT_NAME, font_size)
     text_surface = font.render(text, antialias, color)
     return text_surface, text_surface.get_rect()
 
+# Rendered text shared across element instances, keyed by (font_name, font_size, text, antialias, color).
+# Buttons and sliders re-render the same few strings in each visual state, so this turns re-renders into lookups.
+_TEXT_CACHE = {}
+
+def render_text_cached(font, font_name, font_size, text, color, antialias=True):
+    """Returns font.render(text, antialias, color), reusing a previous render of the same text/font/color."""
+    key = (font_name, font_size, text, antialias, tuple(color))
+    text_surface = _TEXT_CACHE.get(key)
+    if text_surface is None:
+        # Converted to the display format once, since a cached render is blitted many times
+        text_surface = font.render(text, antialias, color).convert_alpha()
+        _TEXT_CACHE[key] = text_surface
+    return text_surface
+
+# Pre-rendered button faces (background, border and label) shared across Button instances.
+# A button flips between the same normal, hover, pressed and disabled faces, so each is drawn only once.
+_BUTTON_FACE_CACHE = {}
+
 class UIElement:
     """Base class for all UI elements."""
     def __init__(self, x, y, w, h, parent_surface=None):
@@ -18,6 +49,13 @@ class UIElement:
         self.disabled = False
         self.tooltip_text = None
         self.id = None # Optional identifier
+        self._visuals_changed = True # Set whenever the element's appearance changes; see consume_visual_changes()
+
+    def consume_visual_changes(self):
+        """Returns True if the element looks different since the last call, and clears the flag."""
+        changed = self._visuals_changed
+        self._visuals_changed = False
+        return changed
 
     def handle_event(self, event, mouse_pos):
         """Handles a single Pygame event. Returns True if event was consumed."""
@@ -32,14 +70,25 @@ class UIElement:
         if not self.visible:
             return # Don't draw if not visible
 
+    def set_position(self, x, y):
+        self.rect.topleft = (x, y)
+        self._visuals_changed = True
+
+    def get_blit_item(self):
+        """Returns a (surface, dest) pair that fully draws the element, or None if draw() must be called."""
+        return None
+
     def set_tooltip(self, text):
         self.tooltip_text = text
 
     def set_visibility(self, visible):
-        self.visible = visible
+        if self.visible != visible:
+            self.visible = visible
+            self._visuals_changed = True
 
     def set_disabled(self, disabled):
         self.disabled = disabled
+        self._visuals_changed = True
         # Potentially trigger a visual update if state changes appearance
         self._on_disabled_changed()
 
@@ -65,9 +114,9 @@ class Label(UIElement):
         self.bg_color = bg_color
         self.padding = padding
 
-        self._font = pygame.font.Font(self.font_name, self.font_size)
-        # Render initially to get dimensions
-        self._text_surface = self._font.render(self.text, self.antialias, self._color)
+        self._font = get_font(self.font_name, self.font_size)
+        # Render initially to get dimensions (converted to the display format, as it is blitted every frame)
+        self._text_surface = self._font.render(self.text, self.antialias, self._color).convert_alpha()
         
         text_w_with_padding = self._text_surface.get_width() + 2 * padding
         text_h_with_padding = self._text_surface.get_height() + 2 * padding
@@ -81,7 +130,7 @@ class Label(UIElement):
 
     def _render_and_realign(self):
         """Internal method to re-render text and realign."""
-        self._text_surface = self._font.render(self.text, self.antialias, self._color)
+        self._text_surface = self._font.render(self.text, self.antialias, self._color).convert_alpha()
         # If label size is not fixed, it could adapt to new text here.
         # For now, assuming fixed size after init or external management.
         self._realign_text()
@@ -89,6 +138,7 @@ class Label(UIElement):
     def _realign_text(self):
         """Adjusts the position of the text surface within the label's rect based on alignment."""
         self.text_rect = self._text_surface.get_rect() # Get rect of the current text_surface
+        self._visuals_changed = True
         
         # Position text_rect relative to self.rect (the Label's bounding box)
         if self.alignment == "left":
@@ -129,6 +179,11 @@ class Label(UIElement):
             pygame.draw.rect(surface, self.bg_color, self.rect)
         surface.blit(self._text_surface, self.text_rect)
 
+    def get_blit_item(self):
+        if self.bg_color: # The background needs a draw call of its own
+            return None
+        return (self._text_surface, self.text_rect)
+
 
 class Button(UIElement):
     def __init__(self, x, y, w, h, text,
@@ -162,8 +217,9 @@ class Button(UIElement):
         self.border_radius = border_radius
         self.border_width = border_width # If > 0, a border of this color will be drawn slightly darker
 
-        self._font = pygame.font.Font(config.FONT_NAME, self.font_size)
+        self._font = get_font(config.FONT_NAME, self.font_size)
         self._current_bg_color = self.colors["normal"]
+        self._current_border_color = self._current_bg_color
         self._current_text_color = self.text_color_normal
         
         self.is_hovered_state = False
@@ -173,8 +229,23 @@ class Button(UIElement):
         if tooltip: self.set_tooltip(tooltip)
 
     def _render_text_surface_internal(self): # Renamed to avoid conflict if subclass uses _render_text_surface
-        self.text_surface = self._font.render(self.text, True, self._current_text_color)
-        self.text_rect = self.text_surface.get_rect(center=self.rect.center)
+        """Selects the pre-rendered face (background, border and label) for the current colors, building it once."""
+        key = (self.text, self.font_size, self.rect.size, self.border_radius, self.border_width,
+               tuple(self._current_bg_color), tuple(self._current_text_color)) # Border color derives from bg
+        face = _BUTTON_FACE_CACHE.get(key)
+        if face is None:
+            face = pygame.Surface(self.rect.size, pygame.SRCALPHA).convert_alpha() # Match display format for blits
+            face_rect = face.get_rect()
+            pygame.draw.rect(face, self._current_bg_color, face_rect, border_radius=self.border_radius)
+            if self.border_width > 0:
+                pygame.draw.rect(face, self._current_border_color, face_rect,
+                                 width=self.border_width, border_radius=self.border_radius)
+            text_surface = render_text_cached(self._font, config.FONT_NAME, self.font_size,
+                                              self.text, self._current_text_color)
+            face.blit(text_surface, text_surface.get_rect(center=face_rect.center))
+            _BUTTON_FACE_CACHE[key] = face
+        self._face_surface = face
+        self._visuals_changed = True
 
     def _on_disabled_changed(self):
         self.is_hovered_state = False
@@ -194,6 +265,8 @@ class Button(UIElement):
         else:
             self._current_bg_color = self.colors["normal"]
             self._current_text_color = self.text_color_normal
+        if self.border_width > 0: # Slightly darker border, derived once per state change instead of per draw
+            self._current_border_color = tuple(max(0, c - 20) for c in self._current_bg_color[:3])
         self._render_text_surface_internal() # Re-render text if color or text changed
 
     def handle_event(self, event, mouse_pos):
@@ -255,13 +328,10 @@ class Button(UIElement):
         if not self.visible:
             return
 
-        pygame.draw.rect(surface, self._current_bg_color, self.rect, border_radius=self.border_radius)
-        
-        if self.border_width > 0:
-            border_color = tuple(max(0, c - 20) for c in self._current_bg_color[:3]) # Slightly darker border
-            pygame.draw.rect(surface, border_color, self.rect, width=self.border_width, border_radius=self.border_radius)
+        surface.blit(self._face_surface, self.rect)
 
-        surface.blit(self.text_surface, self.text_rect)
+    def get_blit_item(self):
+        return (self._face_surface, self.rect)
 
     def set_text(self, new_text):
         if self.text != new_text:
@@ -301,7 +371,7 @@ class InputBox(UIElement):
             "border_invalid": invalid_border_color,
         }
 
-        self._font = pygame.font.Font(config.FONT_NAME, self.font_size)
+        self._font = get_font(config.FONT_NAME, self.font_size)
         self.active = False # Is the input box focused?
         self.is_valid = True # Based on validation_func
         self._cursor_visible = False
@@ -321,7 +391,7 @@ class InputBox(UIElement):
             else: # Default to valid if no specific validation or if empty is allowed
                 self.is_valid = True
         
-        self.txt_surface = self._font.render(self.text, True, self.colors["text"])
+        self.txt_surface = self._font.render(self.text, True, self.colors["text"]).convert_alpha()
 
 
     def handle_event(self, event, mouse_pos):
@@ -474,7 +544,7 @@ class Slider(UIElement):
         self.is_hovered_state = False # Hovering over the handle specifically
         self._current_handle_color = self.handle_colors["normal"]
 
-        self._font = pygame.font.Font(config.FONT_NAME, config.FONT_SIZE_SMALL)
+        self._font = get_font(config.FONT_NAME, config.FONT_SIZE_SMALL)
         
         self._snap_value_to_discrete_step() # Snap initial value if discrete
         self._update_handle_pos_from_value()
@@ -512,7 +582,8 @@ class Slider(UIElement):
     def _update_value_text_surface(self):
         if self.show_value_text:
             display_val_str = f"{self.get_value()}" # get_value() returns int or rounded
-            self.value_text_surface = self._font.render(display_val_str, True, self.value_text_color)
+            self.value_text_surface = render_text_cached(self._font, config.FONT_NAME, config.FONT_SIZE_SMALL,
+                                                         display_val_str, self.value_text_color)
             # Position text to the right of the slider's main rect
             self.value_text_rect = self.value_text_surface.get_rect(
                 midleft=(self.rect.right + 10, self.rect.centery)